@@ -1,6 +1,6 @@
 from random import uniform
 import numpy as np
-from constants import MUTATION_RATE, NUM_OUTPUT_NEURONS, HIDDEN_LAYERS, NUM_INPUT_NEURONS
+from constants import MUTATION_RATE, MUTATION_STRENGTH, NUM_OUTPUT_NEURONS, HIDDEN_LAYERS, NUM_INPUT_NEURONS
 
 
 class Brain:
@@ -121,16 +121,32 @@ class Brain:
     def mutate_weights(self):
         # Mutate input-hidden layer weights
         mask = np.random.rand(*self.input_hidden_weights[0].shape) < MUTATION_RATE
-        self.input_hidden_weights[0] += np.random.normal(0, 0.1, self.input_hidden_weights[0].shape) * mask
+        self.input_hidden_weights[0] += np.random.normal(0, MUTATION_STRENGTH, self.input_hidden_weights[0].shape) * mask
 
         # Mutate hidden-hidden layer weights
         for hidden_weights in self.hidden_hidden_weights:
             mask = np.random.rand(*hidden_weights.shape) < MUTATION_RATE
-            hidden_weights += np.random.normal(0, 0.1, hidden_weights.shape) * mask
+            hidden_weights += np.random.normal(0, MUTATION_STRENGTH, hidden_weights.shape) * mask
 
         # Mutate hidden-output layer weights
         mask = np.random.rand(*self.hidden_output_weights.shape) < MUTATION_RATE
-        self.hidden_output_weights += np.random.normal(0, 0.1, self.hidden_output_weights.shape) * mask
+        self.hidden_output_weights += np.random.normal(0, MUTATION_STRENGTH, self.hidden_output_weights.shape) * mask
+
+
+    def copy(self):
+        """
+        Creates a new brain with the same structure and a copy of this brain's weights,
+        so mutating one of them doesn't change the other.
+
+        Returns:
+            Brain: The copied brain.
+        """
+        brain = Brain(self.num_inputs, self.hidden_layers, self.num_outputs)
+        brain.input_hidden_weights = [weights.copy() for weights in self.input_hidden_weights]
+        brain.hidden_hidden_weights = [weights.copy() for weights in self.hidden_hidden_weights]
+        brain.hidden_output_weights = self.hidden_output_weights.copy()
+
+        return brain
 
 
     def choose_action(self):
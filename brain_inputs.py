@@ -10,17 +10,140 @@ def points_distance(point1, point2):
     return ((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)**0.5
 
 
-def closest_plant(creature, plants):
+class NearestPlantCache:
+    """
+    Remembers the closest plant of every creature between ticks, so it isn't searched for again every tick.
+
+    Each entry stores the position the creature had when its closest plant was found, the distance to that
+    plant and the distance to the second closest one. After moving `m` pixels the cached plant is at most
+    `m` pixels further and every other plant at most `m` pixels closer, so the entry stays correct as long as
+    2 * m <= second_distance - distance. Entries are otherwise only dropped for creatures whose closest plant
+    was eaten, or that are closer to a newly spawned plant than to their second closest plant.
+
+    Attributes:
+        entries (dict): Maps a creature to (plant, x, y, distance, second_distance).
+        hits (int): The number of lookups answered from an entry kept since a previous tick.
+        misses (int): The number of lookups that had to search all the plants.
+        invalidations (int): The number of entries dropped because of eaten or spawned plants.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+
+    def get(self, creature, plants):
+        """
+        Returns the closest plant to the creature, searching the plants only if the cached one may be stale.
+        """
+        entry = self.entries.get(creature)
+
+        if entry is not None:
+            plant, x, y, distance, second_distance = entry
+            moved = points_distance((creature.x, creature.y), (x, y))
+
+            if 2 * moved <= second_distance - distance:
+                self.hits += 1
+                return plant
+
+        self.misses += 1
+        plant, distance, second_distance = self.search(creature, plants)
+        self.entries[creature] = (plant, creature.x, creature.y, distance, second_distance)
+
+        return plant
+
+
+    @staticmethod
+    def search(creature, plants):
+        """
+        Finds the closest plant to the creature, along with its distance and the distance of the second closest plant.
+
+        Raises:
+            ValueError: If there are no plants.
+        """
+        if not plants:
+            raise ValueError("Cannot find the closest plant when there are no plants.")
+
+        closest = None
+        distance = second_distance = float("inf")
+
+        for plant in plants:
+            plant_distance = points_distance((creature.x, creature.y), (plant.x, plant.y))
+
+            if plant_distance < distance:
+                closest, distance, second_distance = plant, plant_distance, distance
+            elif plant_distance < second_distance:
+                second_distance = plant_distance
+
+        return closest, distance, second_distance
+
+
+    def plant_removed(self, plant):
+        """
+        Drops the entries of the creatures whose closest plant was the removed one.
+        Other entries stay correct, since removing a plant can only make the second closest plant further away.
+        """
+        stale = [creature for creature, entry in self.entries.items() if entry[0] is plant]
+
+        for creature in stale:
+            del self.entries[creature]
+
+        self.invalidations += len(stale)
+
+
+    def plant_added(self, plant):
+        """
+        Drops the entries of the creatures that were closer to the new plant than to their second closest plant.
+        """
+        stale = [creature for creature, (_, x, y, _, second_distance) in self.entries.items()
+                 if points_distance((x, y), (plant.x, plant.y)) < second_distance]
+
+        for creature in stale:
+            del self.entries[creature]
+
+        self.invalidations += len(stale)
+
+
+    def forget(self, creature):
+        """
+        Drops the entry of a creature that is no longer part of the simulation.
+        """
+        self.entries.pop(creature, None)
+
+
+    def clear(self):
+        self.entries.clear()
+
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+    def __str__(self):
+        return f"Nearest plant cache: {self.hits} hits, {self.misses} misses ({self.hit_rate():.1%} hit rate), " \
+               f"{self.invalidations} invalidations."
+
+
+def closest_plant(creature, plants, cache=None):
+    if cache is not None:
+        return cache.get(creature, plants)
+
     return min(plants, key=lambda plant: points_distance((creature.x, creature.y), (plant.x, plant.y)))
 
 
-def closest_plant_distance(creature, plants):
-    plant = closest_plant(creature, plants)
+def closest_plant_distance(creature, plants, plant=None):
+    if plant is None:
+        plant = closest_plant(creature, plants)
+
     return points_distance((creature.x, creature.y), (plant.x, plant.y))
 
 
-def angle_from_closest_plant(creature, plants):
-    plant = closest_plant(creature, plants)
+def angle_from_closest_plant(creature, plants, plant=None):
+    if plant is None:
+        plant = closest_plant(creature, plants)
 
     difference_x = creature.x - plant.x
     difference_y = (-creature.y) - (-plant.y)
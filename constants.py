@@ -21,8 +21,13 @@ PLANT_COUNT = 20
 PLANT_ENERGY = 50
 PLANT_IMG_PATH = "resources/tree.png"
 
+# Species clustering
+SPECIES_CHUNK_SIZE = 256
+SPECIES_UPDATE_INTERVAL = 10
+
 # Mutation chances
 MUTATION_RATE = 0.1
+MUTATION_STRENGTH = 0.1
 COLOR_MUTATION_CHANCE = 1
 X_MUTATION_CHANCE = 1
 Y_MUTATION_CHANCE = 1
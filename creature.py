@@ -42,6 +42,7 @@ class Creature:
             y (int): The initial y-coordinate of the creature's location on the screen.
             color (tuple): The initial color of the creature in RGB format.
             name (str): The name of the creature.
+            brain (Brain): The creature's own brain, with its weights already initialized.
         """
         self.x = x
         self.y = y
@@ -58,15 +59,17 @@ class Creature:
         self.total_energy = START_ENERGY
         self.movement_energy_consumed = 0
         self.brain = brain
-        self.brain.initialize_weights()
         self.screen = screen
         self.special = False
         self.reproduction_num = 0
+        self.species = None
 
     
     def __str__(self):
+        species = "unassigned" if self.species is None else f"#{self.species}"
+
         return f"Creature '{self.name}' at position ({self.x},{self.y}) with color {self.color} and {self.energy} energy." \
-               f"\nStep = {self.step}. Traveled {self.total_distance}. Currently facing {self.facing}°."
+               f"\nStep = {self.step}. Traveled {self.total_distance}. Currently facing {self.facing}°. Species {species}."
 
 
     def draw(self):
@@ -105,7 +108,7 @@ class Creature:
                     1) # radius
 
 
-    def get_inputs(self, plants):
+    def get_inputs(self, plants, plant_cache=None):
         """
         The inputs are as follows, in order:
             - Index 0 corresponds to closest_plant_distance: the distance from the closest plant.
@@ -116,10 +119,13 @@ class Creature:
             - Index 5 corresponds to energy_level: the current energy level of the creature.
                              
         The number of input values should match the number of input neurons in the neural network.
+
+        The closest plant is looked up once, through the NearestPlantCache if one is given, and shared by both plant sensors.
         """
+        plant = closest_plant(self, plants, plant_cache)
 
-        inputs = [closest_plant_distance(self, plants),
-                  angle_from_closest_plant(self, plants),
+        inputs = [closest_plant_distance(self, plants, plant),
+                  angle_from_closest_plant(self, plants, plant),
                   int(can_reproduce(self)),
                   screen_edge_distance(self),
                   int(can_move_forward(self)),
@@ -127,8 +133,8 @@ class Creature:
 
         return inputs
 
-    def take_action(self, plants):
-        inputs = self.get_inputs(plants)
+    def take_action(self, plants, plant_cache=None):
+        inputs = self.get_inputs(plants, plant_cache)
         self.brain.set_inputs(inputs)
         self.brain.mutate_weights()
         action, value = self.brain.decide_action()
@@ -174,7 +180,7 @@ class Creature:
     def duplicate(self):
         self.energy -= REPRODUCTION_COST
 
-        return Creature(self.x, self.y, self.color, self.name, self.radius, self.gen + 1, self.brain, self.screen)
+        return Creature(self.x, self.y, self.color, self.name, self.radius, self.gen + 1, self.brain.copy(), self.screen)
 
 
     def reproduce(self):
@@ -4,6 +4,8 @@ from tools import *
 from constants import *
 import random
 from plant import Plant
+from brain_inputs import NearestPlantCache
+from species import SpeciesTracker
 
 
 # Initialize Pygame
@@ -40,6 +42,9 @@ creatures[0].special = True
 
 
 plants = [Plant(randint(10, SCREEN_WIDTH - 10), randint(10, SCREEN_HEIGHT - 10)) for _ in range(PLANT_COUNT)]
+plant_cache = NearestPlantCache()
+species_tracker = SpeciesTracker()
+tick = 0
 
 flag = False
 # Main game loop
@@ -47,6 +52,7 @@ running = True
 while running:
     if len(creatures) == 0:
         print("restarted simulation")
+        plant_cache.clear()
         creatures = [random_creature(CREATURE_RADIUS, SCREEN_WIDTH - CREATURE_RADIUS, CREATURE_RADIUS, SCREEN_HEIGHT - CREATURE_RADIUS) for _ in range(NUM_CREATURES)]
     
     # Handle events
@@ -66,7 +72,7 @@ while running:
 
             # Check if user clicked the Info button
             if i_rect.collidepoint(pos):
-                print(simulation_info(creatures))
+                print(simulation_info(creatures, plant_cache, species_tracker))
 
             # Check if the user clicked on any of the creatures
             if event.button == 1:
@@ -84,17 +90,21 @@ while running:
                     if creature.pygame_rect.collidepoint(pos):
                         creature.remove()
                         creatures.remove(creature)
+                        plant_cache.forget(creature)
 
 
     for plant in plants:
         plant.draw(screen)
 
+    species_tracker.update(creatures, tick)
+    tick += 1
+
 
     # Iterate over all creatures
     for creature in creatures:
         # The creature is now older.
         creature.time_alive += 1
-        action = creature.take_action(plants)
+        action = creature.take_action(plants, plant_cache)
 
         if action:
             creatures.append(action)
@@ -104,6 +114,7 @@ while running:
         if creature.energy <= MIN_CREATURE_ENERGY:
             creature.remove()
             creatures.remove(creature)
+            plant_cache.forget(creature)
             del creature
 
             
@@ -119,10 +130,12 @@ while running:
                 plant.remove(screen)
                 creature.eat(plant)
                 plants.remove(plant)
+                plant_cache.plant_removed(plant)
                 del plant
 
                 new_plant = Plant(randint(10, SCREEN_WIDTH - 10), randint(10, SCREEN_HEIGHT - 10))
                 plants.append(new_plant)
+                plant_cache.plant_added(new_plant)
                 new_plant.draw(screen)
 
 
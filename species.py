@@ -0,0 +1,232 @@
+import numpy as np
+from constants import MUTATION_RATE, MUTATION_STRENGTH, SPECIES_CHUNK_SIZE, SPECIES_UPDATE_INTERVAL
+
+
+def flatten_genome(brain):
+    """
+    Flattens all the weights of a brain into a single vector, in the order the layers are propagated.
+
+    Args:
+        brain (Brain): The brain whose weights should be flattened.
+
+    Returns:
+        numpy.ndarray: A one dimensional array of all the weights.
+    """
+    layers = list(brain.input_hidden_weights) + list(brain.hidden_hidden_weights) + [brain.hidden_output_weights]
+    return np.concatenate([np.ravel(layer) for layer in layers])
+
+
+def genome_matrix(creatures):
+    """
+    Stacks the flattened genomes of the creatures into a matrix, one row per creature.
+    """
+    return np.array([flatten_genome(creature.brain) for creature in creatures], dtype=np.float32)
+
+
+def squared_distances(genomes, representatives):
+    """
+    Computes the squared euclidean distance between every genome and every representative at once,
+    using |a - b|² = |a|² + |b|² - 2a·b so no (genomes x representatives x weights) array is built.
+    """
+    distances = (np.sum(genomes ** 2, axis=1)[:, np.newaxis]
+                 + np.sum(representatives ** 2, axis=1)[np.newaxis, :]
+                 - 2 * genomes @ representatives.T)
+    return np.maximum(distances, 0)
+
+
+def species_threshold(genome_size, interval):
+    """
+    Derives the distance under which two genomes belong to the same species.
+
+    Weights start uniform in [0, 1), so two unrelated genomes are expected to be sqrt(genome_size / 6) apart.
+    Every call to Brain.mutate_weights adds MUTATION_STRENGTH² squared distance to a MUTATION_RATE fraction
+    of the weights. Every creature mutates its own brain once per tick in Creature.take_action, so a genome
+    drifts sqrt(interval * genome_size * MUTATION_RATE) * MUTATION_STRENGTH between updates. The threshold is
+    halfway between the two, so a genome stays close enough to its species' last centroid while unrelated
+    brains stay apart.
+
+    Args:
+        genome_size (int): The number of weights in a genome.
+        interval (int): The number of ticks between species assignments.
+
+    Returns:
+        float: The maximum euclidean distance between a genome and its species' representative.
+    """
+    unrelated_distance = (genome_size / 6) ** 0.5
+    drift = (interval * genome_size * MUTATION_RATE) ** 0.5 * MUTATION_STRENGTH
+
+    return (unrelated_distance + drift) / 2
+
+
+class SpeciesTracker:
+    """
+    Groups creatures into species by the similarity of their brains' weights.
+
+    A creature joins the species with the closest representative if it is within the distance threshold,
+    otherwise it founds a new species with its own genome as the representative. After every assignment
+    each representative is moved to the centroid of its members, so a species keeps its ID while its
+    members mutate. Species that have no members left are forgotten.
+
+    Offspring get a copy of their parent's brain, which then mutates independently every tick, so relatives
+    drift apart. Once members are further from their centroid than the threshold, which with the default
+    settings takes about 65 ticks after their last common ancestor, they found new species. That is a real
+    split: after about 170 ticks two siblings are as far apart as two unrelated brains.
+
+    Genomes are read and compared in chunks against all representatives at once, so memory stays bounded
+    by (chunk_size + number of species) x genome size no matter how large the population is.
+
+    Attributes:
+        threshold (float): The maximum euclidean distance between a genome and its species' representative.
+            Derived with species_threshold from the genome size on the first assignment, unless given.
+        chunk_size (int): The number of genomes compared against the representatives at once.
+        interval (int): The number of ticks between species assignments.
+        representatives (numpy.ndarray): One row per species, of which the first num_species are in use.
+            Doubles when full and halves when less than a quarter is in use.
+        species_ids (numpy.ndarray): The species ID of every row of representatives.
+        num_species (int): The number of species currently alive.
+        sizes (dict): Maps a species ID to the number of creatures assigned to it on the last update.
+    """
+
+    initial_capacity = 16
+
+    def __init__(self, threshold=None, chunk_size=SPECIES_CHUNK_SIZE, interval=SPECIES_UPDATE_INTERVAL):
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.representatives = None
+        self.species_ids = np.empty(0, dtype=np.int64)
+        self.num_species = 0
+        self.sizes = {}
+        self.next_species_id = 0
+
+
+    def update(self, creatures, tick):
+        """
+        Assigns species to the creatures if this tick is a multiple of the update interval.
+
+        Returns:
+            bool: Whether the species were assigned on this tick.
+        """
+        if tick % self.interval != 0 or len(creatures) == 0:
+            return False
+
+        self.assign(creatures)
+        return True
+
+
+    def assign(self, creatures):
+        """
+        Sets the `species` attribute of every creature, recounts the species sizes
+        and moves every representative to the centroid of its members.
+        """
+        rows = np.empty(len(creatures), dtype=np.int64)
+        sums = None
+
+        for start in range(0, len(creatures), self.chunk_size):
+            genomes = genome_matrix(creatures[start:start + self.chunk_size])
+            chunk_rows = self.assign_chunk(genomes)
+            rows[start:start + len(chunk_rows)] = chunk_rows
+
+            # Accumulate the members' genomes of every species, growing along with the representatives
+            if sums is None or len(sums) < self.num_species:
+                grown = np.zeros((len(self.representatives), genomes.shape[1]), dtype=np.float64)
+
+                if sums is not None:
+                    grown[:len(sums)] = sums
+
+                sums = grown
+
+            order = np.argsort(chunk_rows, kind="stable")
+            present, starts = np.unique(chunk_rows[order], return_index=True)
+            sums[present] += np.add.reduceat(genomes[order], starts, axis=0)
+
+        counts = np.bincount(rows, minlength=self.num_species)
+        alive = counts > 0
+        ids = self.species_ids[:self.num_species]
+
+        for creature, species_id in zip(creatures, ids[rows]):
+            creature.species = int(species_id)
+
+        self.sizes = dict(zip(ids[alive].tolist(), counts[alive].tolist()))
+
+        # Move every representative to its members' centroid and forget the species that went extinct
+        num_alive = int(np.count_nonzero(alive))
+        self.representatives[:num_alive] = sums[:self.num_species][alive] / counts[alive][:, np.newaxis]
+        self.species_ids[:num_alive] = ids[alive]
+        self.num_species = num_alive
+
+        # Give back the memory left over from a burst of species that went extinct
+        capacity = len(self.representatives)
+
+        while capacity > self.initial_capacity and self.num_species < capacity // 4:
+            capacity //= 2
+
+        if capacity < len(self.representatives):
+            self.representatives = self.representatives[:capacity].copy()
+            self.species_ids = self.species_ids[:capacity].copy()
+
+
+    def assign_chunk(self, genomes):
+        """
+        Returns the row in representatives of the species every genome belongs to, founding new species as needed.
+        """
+        if self.threshold is None:
+            self.threshold = species_threshold(genomes.shape[1], self.interval)
+
+        rows = np.full(len(genomes), -1, dtype=np.int64)
+        max_distance = self.threshold ** 2
+
+        # Join the existing species whose representative is the closest
+        if self.num_species > 0:
+            distances = squared_distances(genomes, self.representatives[:self.num_species])
+            closest = np.argmin(distances, axis=1)
+            within = distances[np.arange(len(genomes)), closest] <= max_distance
+            rows[within] = closest[within]
+
+        # Every genome left unassigned founds a new species, which the rest of the chunk may join
+        unassigned = np.flatnonzero(rows == -1)
+
+        while len(unassigned) > 0:
+            founder = unassigned[0]
+            row = self.add_species(genomes[founder])
+
+            distances = squared_distances(genomes[unassigned], genomes[founder][np.newaxis, :])[:, 0]
+            rows[unassigned[distances <= max_distance]] = row
+            rows[founder] = row
+
+            unassigned = np.flatnonzero(rows == -1)
+
+        return rows
+
+
+    def add_species(self, genome):
+        """
+        Appends a new species represented by the genome, doubling the representatives array when it is full.
+
+        Returns:
+            int: The row of the new species in representatives.
+        """
+        if self.representatives is None:
+            self.representatives = np.empty((self.initial_capacity, len(genome)), dtype=np.float32)
+            self.species_ids = np.empty(self.initial_capacity, dtype=np.int64)
+        elif self.num_species == len(self.representatives):
+            self.representatives = np.concatenate([self.representatives, np.empty_like(self.representatives)])
+            self.species_ids = np.concatenate([self.species_ids, np.empty_like(self.species_ids)])
+
+        row = self.num_species
+        self.representatives[row] = genome
+        self.species_ids[row] = self.next_species_id
+        self.next_species_id += 1
+        self.num_species += 1
+
+        return row
+
+
+    def __str__(self):
+        if not self.sizes:
+            return "No species assigned yet."
+
+        largest = sorted(self.sizes.items(), key=lambda item: item[1], reverse=True)[:5]
+        largest = ", ".join(f"#{species_id}: {size}" for species_id, size in largest)
+
+        return f"{len(self.sizes)} species. Largest: {largest}."
@@ -0,0 +1,98 @@
+import random
+from brain_inputs import NearestPlantCache, closest_plant, closest_plant_distance, points_distance
+
+
+class Thing:
+    """
+    Stands in for a creature or a plant, which the cache only needs to be hashable and have a position.
+    """
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def random_point(rng):
+    return rng.randint(0, 1000), rng.randint(0, 700)
+
+
+def random_plant(rng):
+    return Thing(*random_point(rng))
+
+
+def nearest_distance(creature, plants):
+    return min(points_distance((creature.x, creature.y), (plant.x, plant.y)) for plant in plants)
+
+
+def test_cache_matches_brute_force():
+    rng = random.Random(0)
+    plants = [random_plant(rng) for _ in range(20)]
+    creatures = [Thing(*random_point(rng)) for _ in range(30)]
+    cache = NearestPlantCache()
+
+    for tick in range(500):
+        for creature in creatures:
+            if rng.random() < 0.02:
+                # Teleport now and then, so stale entries for far moves are exercised too
+                creature.x, creature.y = random_point(rng)
+            else:
+                creature.x += rng.randint(-5, 5)
+                creature.y += rng.randint(-5, 5)
+
+            plant = cache.get(creature, plants)
+            assert plant in plants
+            assert points_distance((creature.x, creature.y), (plant.x, plant.y)) == nearest_distance(creature, plants)
+
+            # Eat the closest plant now and then, and spawn a new one in its place
+            if rng.random() < 0.02:
+                plants.remove(plant)
+                cache.plant_removed(plant)
+
+                new_plant = random_plant(rng)
+                plants.append(new_plant)
+                cache.plant_added(new_plant)
+
+    assert cache.hits + cache.misses == 500 * len(creatures)
+    assert cache.hits > cache.misses
+    assert cache.invalidations > 0
+
+
+def test_plant_removed_only_drops_its_creatures():
+    plants = [Thing(0, 0), Thing(500, 0)]
+    near_first = Thing(10, 0)
+    near_second = Thing(490, 0)
+    cache = NearestPlantCache()
+
+    eaten = cache.get(near_first, plants)
+    cache.get(near_second, plants)
+    plants.remove(eaten)
+    cache.plant_removed(eaten)
+
+    assert near_first not in cache.entries
+    assert near_second in cache.entries
+    assert cache.invalidations == 1
+
+
+def test_plant_added_only_drops_nearby_creatures():
+    plants = [Thing(0, 0), Thing(100, 0)]
+    creature = Thing(10, 0)
+    cache = NearestPlantCache()
+
+    cache.get(creature, plants)
+    cache.plant_added(Thing(900, 600))
+    assert creature in cache.entries
+
+    cache.plant_added(Thing(20, 0))
+    assert creature not in cache.entries
+
+
+def test_sensors_share_a_looked_up_plant():
+    plants = [Thing(0, 0), Thing(100, 0)]
+    creature = Thing(30, 40)
+    cache = NearestPlantCache()
+
+    plant = closest_plant(creature, plants, cache)
+
+    assert plant is plants[0]
+    assert closest_plant_distance(creature, plants, plant) == closest_plant_distance(creature, plants) == 50
+    assert (cache.hits, cache.misses) == (0, 1)
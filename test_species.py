@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+import numpy as np
+from brain import Brain
+from constants import NUM_INPUT_NEURONS, HIDDEN_LAYERS, NUM_OUTPUT_NEURONS
+from species import flatten_genome, squared_distances, species_threshold, SpeciesTracker
+
+GENOME_SIZE = 6 * 10 + 10 * 20 + 20 * 10 + 10 * 5
+
+
+def random_brain():
+    brain = Brain(NUM_INPUT_NEURONS, HIDDEN_LAYERS, NUM_OUTPUT_NEURONS)
+    brain.initialize_weights()
+    return brain
+
+
+def lineages(num_founders, creatures_per_founder):
+    """
+    Creates creatures whose brains are copies of a few founders' brains, the way Creature.duplicate copies them.
+    """
+    founders = [random_brain() for _ in range(num_founders)]
+    return [SimpleNamespace(brain=founder.copy(), species=None) for founder in founders for _ in range(creatures_per_founder)]
+
+
+def live(creatures, ticks):
+    """
+    Mutates every creature's brain once per tick, like Creature.take_action does.
+    """
+    for _ in range(ticks):
+        for creature in creatures:
+            creature.brain.mutate_weights()
+
+
+def test_flatten_genome():
+    brain = random_brain()
+    genome = flatten_genome(brain)
+
+    assert genome.shape == (GENOME_SIZE,)
+    assert np.array_equal(genome[:60], brain.input_hidden_weights[0].ravel())
+    assert np.array_equal(genome[-50:], brain.hidden_output_weights.ravel())
+
+
+def test_squared_distances():
+    rng = np.random.default_rng(0)
+    genomes = rng.random((7, 20))
+    representatives = rng.random((3, 20))
+    expected = ((genomes[:, np.newaxis, :] - representatives[np.newaxis, :, :]) ** 2).sum(axis=2)
+
+    assert np.allclose(squared_distances(genomes, representatives), expected)
+
+
+def test_threshold_separates_drift_from_unrelated_genomes():
+    threshold = species_threshold(GENOME_SIZE, 10)
+
+    assert (10 * GENOME_SIZE * 0.1) ** 0.5 * 0.1 < threshold < (GENOME_SIZE / 6) ** 0.5
+
+
+def test_species_follow_mutating_lineages():
+    np.random.seed(0)
+    creatures = lineages(num_founders=5, creatures_per_founder=4)
+    tracker = SpeciesTracker(chunk_size=8, interval=10)
+
+    tracker.update(creatures, 0)
+    first = [creature.species for creature in creatures]
+
+    assert sorted(tracker.sizes.values()) == [4] * 5
+
+    for update in range(1, 4):
+        live(creatures, tracker.interval)
+        assert tracker.update(creatures, update * tracker.interval)
+        assert [creature.species for creature in creatures] == first
+        assert sorted(tracker.sizes.values()) == [4] * 5
+
+    assert tracker.num_species == 5
+
+
+def test_update_only_on_interval():
+    creatures = lineages(num_founders=2, creatures_per_founder=1)
+    tracker = SpeciesTracker(interval=10)
+
+    assert not tracker.update(creatures, 3)
+    assert all(creature.species is None for creature in creatures)
+    assert tracker.update(creatures, 20)
+
+
+def test_extinct_species_are_forgotten():
+    np.random.seed(1)
+    creatures = lineages(num_founders=40, creatures_per_founder=2)
+    tracker = SpeciesTracker(chunk_size=16)
+
+    tracker.assign(creatures)
+    assert tracker.num_species == 40
+
+    survivors = creatures[:10]
+    tracker.assign(survivors)
+
+    assert tracker.num_species == 5
+    assert set(tracker.sizes) == {creature.species for creature in survivors}
+    assert set(tracker.species_ids[:tracker.num_species].tolist()) == set(tracker.sizes)
+
+    newcomers = lineages(num_founders=1, creatures_per_founder=3)
+    tracker.assign(survivors + newcomers)
+
+    assert tracker.num_species == 6
+    assert newcomers[0].species == tracker.next_species_id - 1
+
+
+def test_representatives_shrink_after_extinctions():
+    np.random.seed(2)
+    creatures = lineages(num_founders=100, creatures_per_founder=1)
+    tracker = SpeciesTracker()
+
+    tracker.assign(creatures)
+    assert len(tracker.representatives) == 128
+
+    tracker.assign(creatures[:20])
+    assert len(tracker.representatives) == 64
+    assert tracker.num_species == 20
+
+    tracker.assign(creatures[:1])
+    assert len(tracker.representatives) == SpeciesTracker.initial_capacity
+    assert tracker.sizes == {creatures[0].species: 1}
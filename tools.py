@@ -36,16 +36,26 @@ def random_creature(min_x, max_x, min_y, max_y, screen):
     y = randint(min_y, max_y)
     color = [randint(0, 255) for _ in range(3)]
     name = generate_random_string(16)
+    brain = Brain(NUM_INPUT_NEURONS, HIDDEN_LAYERS, NUM_OUTPUT_NEURONS)
+    brain.initialize_weights()
 
-    return Creature(x, y, color, name, CREATURE_RADIUS, 1, Brain(NUM_INPUT_NEURONS, HIDDEN_LAYERS, NUM_OUTPUT_NEURONS), screen)
+    return Creature(x, y, color, name, CREATURE_RADIUS, 1, brain, screen)
 
 
-def simulation_info(creatures):
+def simulation_info(creatures, plant_cache=None, species_tracker=None):
     avg_step = sum([creature.step for creature in creatures]) / len(creatures)
     last_gen = max([creature.gen for creature in creatures])
     
-    return f"Creature start: {NUM_CREATURES}, current: {len(creatures)}\n"\
-          f"The average step is {avg_step}. Latest generation is {last_gen}."
+    info = f"Creature start: {NUM_CREATURES}, current: {len(creatures)}\n"\
+           f"The average step is {avg_step}. Latest generation is {last_gen}."
+
+    if plant_cache is not None:
+        info += f"\n{plant_cache}"
+
+    if species_tracker is not None:
+        info += f"\n{species_tracker}"
+
+    return info
 
 
 def points_distance(point1, point2):